@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 2026
+@name:   Import Time Benchmark
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import sys
+import json
+import argparse
+import subprocess
+import importlib.util
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["benchmark", "check"]
+__copyright__ = "Copyright 2026, Jack Kirby Cook"
+__license__ = ""
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGETS = {"files.csvs": ["pandas", "numpy", "fiona", "files.archives", "zipfile"], "files.dataframes": ["pandas", "numpy", "fiona"], "files.shapes": ["pandas", "numpy", "fiona", "zipfile"]}
+EAGER = {"files.csvs": ["files.archives"], "files.dataframes": ["pandas", "numpy"], "files.shapes": ["zipfile"]}
+DEPENDENCIES = {"files.csvs": ["utilities"], "files.dataframes": ["utilities", "pandas", "numpy"], "files.shapes": ["utilities"]}
+
+
+STUBS = {
+    "utilities": "",
+    "utilities.meta": """
+from abc import ABCMeta
+_astuple = lambda items: tuple(items) if isinstance(items, (tuple, list, set)) else (items,)
+class RegistryMeta(ABCMeta):
+    def __new__(mcs, name, bases, attrs, *args, **kwargs): return super().__new__(mcs, name, bases, attrs)
+    def __init__(cls, name, bases, attrs, *args, key=None, keys=(), **kwargs):
+        super().__init__(name, bases, attrs)
+        if not any(isinstance(base, RegistryMeta) for base in bases):
+            cls.__registry__ = {}
+        keys = _astuple(key) + _astuple(keys) if key is not None else _astuple(keys)
+        cls.__registry__.update({value: cls for value in keys})
+    def __getitem__(cls, key): return cls.__registry__[key]
+""",
+    "utilities.dispatchers": """
+def keywordDispatcher(keyword):
+    def decorator(function):
+        registry = {}
+        def wrapper(self, *args, **kwargs): return registry.get(kwargs[keyword], function)(self, *args, **kwargs)
+        def register(*keys):
+            def inner(method):
+                registry.update({key: method for key in keys})
+                return method
+            return inner
+        wrapper.register = register
+        return wrapper
+    return decorator
+""",
+    "utilities.shapes": "class Shape(object): pass",
+    "pandas": "",
+    "numpy": "",
+    "fiona": "",
+}
+
+
+CHILD = """
+import sys
+import json
+import time
+import importlib.util
+from types import ModuleType
+
+root, target, eager, forbidden, stubs = json.loads(sys.argv[1])
+
+class StubFinder(object):
+    def find_spec(self, name, path=None, target=None):
+        return importlib.util.spec_from_loader(name, self, is_package=(name == "utilities")) if name in stubs else None
+    def create_module(self, spec): return None
+    def exec_module(self, module): exec(stubs[module.__name__], module.__dict__)
+
+sys.meta_path.append(StubFinder())
+package = ModuleType("files")
+package.__path__ = [root]
+sys.modules["files"] = package
+
+start = time.perf_counter()
+for name in eager + [target]:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - start
+loaded = sorted(name for name in forbidden if name in sys.modules)
+print(json.dumps(dict(seconds=elapsed, loaded=loaded)))
+"""
+
+
+def run(target, eager=[], forbidden=[], stubs={}):
+    arguments = json.dumps([ROOT, target, eager, forbidden, stubs])
+    process = subprocess.run([sys.executable, "-c", CHILD, arguments], capture_output=True, text=True, check=True)
+    return json.loads(process.stdout)
+
+
+def missing(target): return [name for name in DEPENDENCIES[target] if importlib.util.find_spec(name) is None]
+
+
+def benchmark(target, repeat=5):
+    lazy = [run(target) for _ in range(repeat)]
+    eager = [run(target, eager=EAGER[target]) for _ in range(repeat)]
+    return min(result["seconds"] for result in lazy), min(result["seconds"] for result in eager)
+
+
+def check(target):
+    loaded = run(target, forbidden=TARGETS[target], stubs=STUBS)["loaded"]
+    assert not loaded, "import {} loaded {}".format(target, ", ".join(loaded))
+
+
+def main(*args, repeat, **kwargs):
+    for target in TARGETS.keys():
+        check(target)
+        if missing(target):
+            print("{:<20} timing skipped, not installed: {}".format(target, ", ".join(missing(target))))
+            continue
+        lazy, eager = benchmark(target, repeat=repeat)
+        print("{:<20} lazy={:8.2f}ms  eager={:8.2f}ms  saving={:8.2f}ms  ({})".format(target, lazy * 1000, eager * 1000, (eager - lazy) * 1000, ", ".join(EAGER[target])))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cumulative import time of the files modules in a fresh interpreter.")
+    parser.add_argument("--repeat", type=int, default=5)
+    main(**vars(parser.parse_args()))
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 2026
+@name:   CSVArchive Reader/Writer Objects
+@author: Jack Kirby Cook
+
+"""
+
+from files.archives import Archive
+from files.csvs import CSVHandler
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["CSVArchive"]
+__copyright__ = "Copyright 2026, Jack Kirby Cook"
+__license__ = ""
+
+
+class CSVArchive(Archive):
+    __module__ = "files.csvs"
+
+    def execute(self, *args, mode, fields=None, **kwargs): return CSVHandler[mode](self.source, *args, fields=fields, **kwargs)
+
+
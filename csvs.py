@@ -12,7 +12,6 @@ from abc import ABC
 from utilities.meta import RegistryMeta
 
 from files.files import File, FileLocation
-from files.archives import Archive
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
@@ -30,10 +29,6 @@ class CSVFile(File):
     def execute(self, *args, mode, fields=None, **kwargs): return CSVHandler[mode](self.source, *args, fields=fields, **kwargs)
 
 
-class CSVArchive(Archive):
-    def execute(self, *args, mode, fields=None, **kwargs): return CSVHandler[mode](self.source, *args, fields=fields, **kwargs)
-
-
 class CSVHandler(ABC, metaclass=RegistryMeta):
     def __init__(self, source, *args, header, fields=None, **kwargs):
         assert isinstance(fields, (list, type(None)))
@@ -90,4 +85,10 @@ class CSVAppender(CSVHandler, key="a"):
         self.source.writerow(row)
 
 
+def __getattr__(name):
+    if name != "CSVArchive":
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    from files.csvarchives import CSVArchive
+    return CSVArchive
+
 
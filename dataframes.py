@@ -7,13 +7,11 @@ Created on Fri Jun 22 2018
 """
 
 import os.path
-import pandas as pd
-import numpy as np
 from abc import ABC, ABCMeta, abstractmethod
 
 from utilities.meta import RegistryMeta
 
-from files.files import File
+from files.files import File, _LazyModule
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
@@ -22,7 +20,11 @@ __copyright__ = "Copyright 2018, Jack Kirby Cook"
 __license__ = ""
 
 
-NAN_TOFILE = ["None", None, np.NaN, ""]
+pd = _LazyModule("pandas")
+np = _LazyModule("numpy")
+
+
+NAN_TOFILE = ["None", None, float("nan"), ""]
 NAN_FROMFILE = ["", "nan", "NaN", "NA", "N/A", "None"]
 
 
@@ -9,6 +9,8 @@ Created on Weds Jan 12 2022
 import threading
 from enum import Enum
 from abc import ABC
+from types import ModuleType
+from importlib import import_module
 
 from utilities.meta import RegistryMeta
 
@@ -24,6 +26,22 @@ _astuple = lambda items: tuple(items) if isinstance(items, (tuple, list, set)) e
 _flatten = lambda y: [i for x in y for i in x]
 
 
+# attributes set by ModuleType itself (__doc__, __spec__, __loader__, __package__) describe the proxy and are not forwarded
+class _LazyModule(ModuleType):
+    def __init__(self, name):
+        super().__init__(name)
+        self.__module = None
+
+    def __repr__(self): return "{}({})".format(self.__class__.__name__, self.__name__)
+    def __dir__(self): return dir(self.__load())
+    def __getattr__(self, attribute): return getattr(self.__load(), attribute)
+
+    def __load(self):
+        if self.__module is None:
+            self.__module = import_module(self.__name__)
+        return self.__module
+
+
 class FileLocation(Enum):
     START = 0
     CURRENT = 1
@@ -6,16 +6,14 @@ Created on Fri Jun 24 2022
 
 """
 
-# import fiona
 import os.path
 from abc import ABC
-from zipfile import Path
 from collections import OrderedDict as ODict
 
 from utilities.meta import RegistryMeta
 from utilities.shapes import Shape
 
-from files.files import File
+from files.files import File, _LazyModule
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
@@ -24,6 +22,10 @@ __copyright__ = "Copyright 2022, Jack Kirby Cook"
 __license__ = ""
 
 
+fiona = _LazyModule("fiona")
+zipfile = _LazyModule("zipfile")
+
+
 _aslist = lambda items: list(items) if isinstance(items, (tuple, list, set)) else [items]
 _astuple = lambda items: tuple(items) if isinstance(items, (tuple, list, set)) else (items,)
 _filter = lambda items, by: [item for item in _aslist(items) if item is not by]
@@ -55,7 +57,7 @@ class ShapeFile(File):
     def __init__(self, *args, file, **kwargs):
         assert str(file).endswith(".shp")
         archive, file = self.split(file)
-        path = Path(archive, file)
+        path = zipfile.Path(archive, file)
         uri = "zip://{}!{}".format(path.root.filename, path.name)
         super().__init__(*args, file=file, **kwargs)
         self.__uri = uri